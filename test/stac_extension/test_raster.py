@@ -120,3 +120,47 @@ class RasterTest(unittest.TestCase):
             "the stac-extension 'raster'. No scaling is applied."
         )
         self.assertEqual(msg, str(cm.output[-1]))
+
+    def test_apply_offset_scaling_dtype(self):
+        item = create_raster_stac_item()
+        ds = xr.Dataset()
+        ds["B01"] = xr.DataArray(
+            data=np.array([[0, 3, 3], [1, 1, 1], [2, 2, 2]], dtype=np.uint16),
+            dims=("y", "x"),
+            coords=dict(y=[5000, 5010, 5020], x=[7430, 7440, 7450]),
+        ).chunk()
+        ds["B02"] = xr.DataArray(
+            data=np.array([[3, 3, 3], [1, 1, 1], [2, 0, 2]], dtype=np.int32),
+            dims=("y", "x"),
+            coords=dict(y=[5000, 5010, 5020], x=[7430, 7440, 7450]),
+        )
+        ds_mod = apply_offset_scaling(ds, item, asset_name="B01")
+        ds_mod = apply_offset_scaling(ds_mod, item, asset_name="B02")
+        self.assertEqual(np.float32, ds_mod["B01"].dtype)
+        self.assertEqual(np.float32, ds_mod["B01"].compute().dtype)
+        self.assertEqual(np.float64, ds_mod["B02"].dtype)
+        np.testing.assert_allclose(
+            np.array([[np.nan, 0.25, 0.25], [0.05, 0.05, 0.05], [0.15, 0.15, 0.15]]),
+            ds_mod["B01"].values,
+            rtol=1e-6,
+        )
+
+    def test_apply_offset_scaling_identity(self):
+        item = create_raster_stac_item()
+        item.assets["B01"].extra_fields["raster:bands"] = [dict(scale=1.0, offset=0.0)]
+        item.assets["B02"].extra_fields["raster:bands"] = [dict(scale=1, offset=0)]
+        ds = xr.Dataset()
+        for asset_name in ["B01", "B02"]:
+            ds[asset_name] = xr.DataArray(
+                data=np.array([[0, 3, 3], [1, 1, 1], [2, 2, 2]], dtype=np.uint16),
+                dims=("y", "x"),
+                coords=dict(y=[5000, 5010, 5020], x=[7430, 7440, 7450]),
+            ).chunk()
+        ds_mod = apply_offset_scaling(ds, item, asset_name="B01")
+        ds_mod = apply_offset_scaling(ds_mod, item, asset_name="B02")
+        # float scale and offset promote integer data, even if they are identities
+        self.assertEqual(np.float64, ds_mod["B01"].dtype)
+        self.assertEqual(np.uint16, ds_mod["B02"].dtype)
+        np.testing.assert_allclose(
+            np.array([[0, 3, 3], [1, 1, 1], [2, 2, 2]]), ds_mod["B01"].values
+        )
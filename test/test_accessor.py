@@ -40,6 +40,7 @@ class TestS3Sentinel2DataAccessor(unittest.TestCase):
             secret="xxx",
             client_kwargs=dict(endpoint_url="https://eodata.dataspace.copernicus.eu"),
         )
+        self.storage_options = storage_options
         self.accessor = S3Sentinel2DataAccessor(
             root="eodata", storage_options=storage_options
         )
@@ -57,6 +58,17 @@ class TestS3Sentinel2DataAccessor(unittest.TestCase):
         msg = "DEBUG:xcube.stac:Exit rasterio.env.Env for CDSE data access."
         self.assertEqual(msg, str(cm.output[-1]))
 
+    def test_close(self):
+        with dask.config.set(scheduler="threads"):
+            accessor = S3Sentinel2DataAccessor(
+                root="eodata", storage_options=self.storage_options
+            )
+            self.assertEqual("single-threaded", dask.config.get("scheduler"))
+            accessor.close()
+            self.assertIsNone(accessor.env)
+            # datasets opened by the accessor may still be computed
+            self.assertEqual("single-threaded", dask.config.get("scheduler"))
+
     def test_root(self):
         self.assertEqual("eodata", self.accessor.root)
 
@@ -73,6 +85,7 @@ class TestS3Sentinel2DataAccessor(unittest.TestCase):
         # set-up mock for rasterio.open
         mock_rio_dataset = MagicMock()
         mock_rio_dataset.overviews.return_value = [2, 4, 8]
+        mock_rio_dataset.block_shapes = [(1024, 1024)]
         mock_rasterio_open.return_value.__enter__.return_value = mock_rio_dataset
 
         # start tests
@@ -119,3 +132,34 @@ class TestS3Sentinel2DataAccessor(unittest.TestCase):
         self.assertCountEqual(
             [1024, 1024], [ds.chunksizes["x"][0], ds.chunksizes["y"][0]]
         )
+
+    @patch("rasterio.open")
+    @patch("rioxarray.open_rasterio")
+    def test_open_data_chunks(self, mock_rioxarray_open, mock_rasterio_open):
+        mock_rioxarray_open.return_value = xr.Dataset(
+            {"band_1": (("y", "x"), da.ones((2048, 2048)))}
+        )
+        access_params = dict(protocol="s3", root="eodata", fs_path="test.tif")
+        # block shapes are given as (height, width)
+        cases = [
+            ((512, 512), dict(x=1024, y=1024)),
+            ((1024, 1024), dict(x=1024, y=1024)),
+            ((384, 384), dict(x=768, y=768)),
+            ((1, 10980), dict(x=10980, y=1024)),
+        ]
+        for block_shape, chunks in cases:
+            with self.subTest(block_shape=block_shape):
+                mock_rio_dataset = MagicMock()
+                mock_rio_dataset.overviews.return_value = [2, 4, 8]
+                mock_rio_dataset.block_shapes = [block_shape]
+                mock_rasterio_open.return_value.__enter__.return_value = (
+                    mock_rio_dataset
+                )
+                mlds = self.accessor.open_data(access_params, data_type="mldataset")
+                _ = mlds.base_dataset
+                mock_rioxarray_open.assert_called_with(
+                    "s3://eodata/test.tif",
+                    overview_level=None,
+                    chunks=chunks,
+                    band_as_variable=True,
+                )
@@ -96,6 +96,16 @@ class HrefParseTest(unittest.TestCase):
         for expected, href in zip(expected_returns, hrefs):
             self.assertEqual(expected, decode_href(href), msg=href)
 
+    def test_decode_href_cached_storage_options(self):
+        href = "https://bucket-name.s3.eu-central-1.amazonaws.com/filename"
+        storage_options = decode_href(href)[3]
+        storage_options["client_kwargs"]["region_name"] = "us-west-2"
+        storage_options["anon"] = True
+        self.assertEqual(
+            dict(client_kwargs=dict(region_name="eu-central-1")),
+            decode_href(href)[3],
+        )
+
     def test_assert_aws_s3_bucket(self):
         with self.assertRaises(DataStoreError) as cm:
             bucket = "test_123-s3alias"
@@ -19,10 +19,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import datetime
 import itertools
+import json
 import unittest
+from unittest.mock import MagicMock, patch
 import urllib.request
 
+import pystac
 import pytest
 import requests
 import xarray as xr
@@ -40,6 +44,8 @@ from xcube_stac.constants import DATA_STORE_ID_XCUBE
 from xcube_stac.constants import DATA_STORE_ID_CDSE
 from xcube_stac.accessor import HttpsDataAccessor
 from xcube_stac.accessor import S3DataAccessor
+from xcube_stac.helper import Helper
+from xcube_stac.store_mode import SingleStoreMode
 
 SKIP_HELP = (
     "Skipped, because server is not running:"
@@ -961,6 +967,34 @@ class StacDataStoreTest(unittest.TestCase):
             store._impl.access_item(self.data_id_nonsearchable.replace("z", "s"))
         self.assertIn("404 Client Error: Not Found for url", f"{cm.exception}")
 
+    def test_access_item_cached(self):
+        catalog = pystac.Catalog(id="test-catalog", description="Test catalog")
+        item = pystac.Item(
+            id="example-item",
+            geometry=None,
+            bbox=None,
+            datetime=datetime.datetime(2023, 1, 1),
+            properties={},
+        )
+        store_mode = SingleStoreMode(
+            catalog, "https://example.com/", False, {}, Helper()
+        )
+        url = "https://example.com/example-item.json"
+        response = MagicMock(ok=True, text=json.dumps(item.to_dict()))
+        with patch(
+            "xcube_stac.store_mode.requests.request", return_value=response
+        ) as mock_request:
+            item1 = store_mode.access_item("example-item.json")
+            item1.properties["test"] = 1
+            item1.add_asset("test", pystac.Asset(href="https://example.com/t.tif"))
+            item2 = store_mode.access_item("example-item.json")
+        mock_request.assert_called_once_with(method="GET", url=url)
+        self.assertEqual("example-item", item2.id)
+        self.assertNotIn("test", item2.properties)
+        self.assertNotIn("test", item2.assets)
+        self.assertNotIn("test", store_mode._item_dicts[url]["properties"])
+        self.assertNotIn("test", store_mode._item_dicts[url]["assets"])
+
     @pytest.mark.vcr()
     def test_get_s3_accessor(self):
         store = new_data_store(DATA_STORE_ID, url=self.url_searchable)
@@ -983,11 +1017,17 @@ class StacDataStoreTest(unittest.TestCase):
         self.assertEqual("datasets2", opener2.root)
         self.assertEqual(1, len(cm.output))
         msg = (
-            "DEBUG:xcube.stac:The bucket 'datasets' of the S3 object storage "
-            "changed to 'datasets2'. A new s3 data opener will be initialized."
+            "DEBUG:xcube.stac:A new s3 data opener will be initialized for the "
+            "bucket 'datasets2' of the S3 object storage."
         )
         self.assertEqual(msg, str(cm.output[-1]))
 
+        access_params = dict(
+            root="datasets",
+            storage_options={"test_storage_options": False},
+        )
+        self.assertIs(opener, store._impl._get_s3_accessor(access_params))
+
     @pytest.mark.vcr()
     def test_get_https_accessor(self):
         store = new_data_store(DATA_STORE_ID, url=self.url_searchable)
@@ -1008,8 +1048,12 @@ class StacDataStoreTest(unittest.TestCase):
         self.assertEqual("planetarycomputer.microsoft.com", opener2.root)
         self.assertEqual(1, len(cm.output))
         msg = (
-            "DEBUG:xcube.stac:The root 'earth-search.aws.element84.com' of the "
-            "https data opener changed to 'planetarycomputer.microsoft.com'. "
-            "A new https data opener will be initialized."
+            "DEBUG:xcube.stac:A new https data opener will be initialized for "
+            "'planetarycomputer.microsoft.com'."
         )
         self.assertEqual(msg, str(cm.output[-1]))
+
+        access_params = dict(
+            root="earth-search.aws.element84.com",
+        )
+        self.assertIs(opener, store._impl._get_https_accessor(access_params))
@@ -404,6 +404,35 @@ class UtilsTest(unittest.TestCase):
         ds_merged_expected["B03"] = ds3["B03"]
         xr.testing.assert_allclose(ds_merged_expected.B01, ds_merged.B01)
 
+        # the finest dataset, which defines the target grid, forms its own group
+        ds_merged = merge_datasets([ds1, ds2])
+        self.assertIn("crs", ds_merged)
+        self.assertNotIn("spatial_ref", ds_merged.coords)
+        self.assertCountEqual(["B01", "B02", "crs"], list(ds_merged.data_vars))
+        np.testing.assert_allclose(ds2.x.values, ds_merged.x.values)
+        np.testing.assert_allclose(ds2.y.values, ds_merged.y.values)
+        xr.testing.assert_allclose(ds2["B02"], ds_merged["B02"])
+        self.assertFalse(ds_merged["B01"].isnull().all())
+
+    def test_merge_datasets_same_resolution(self):
+        ds_list = []
+        for idx in range(2):
+            ds = xr.Dataset()
+            ds[f"B0{idx + 1}"] = xr.DataArray(
+                data=np.full((2, 2), idx),
+                dims=("y", "x"),
+                coords=dict(x=[1000, 1010], y=[1000, 1010]),
+            )
+            ds["B00"] = xr.DataArray(data=np.full((2, 2), idx), dims=("y", "x"))
+            ds_list.append(ds.assign_coords(spatial_ref=idx + 1))
+        ds_merged = merge_datasets(ds_list)
+        # like Dataset.update, the last dataset wins for shared variables
+        self.assertCountEqual(["B00", "B01", "B02", "crs"], list(ds_merged))
+        self.assertEqual(2, ds_merged["crs"].item())
+        np.testing.assert_equal(np.full((2, 2), 1), ds_merged["B00"].values)
+        np.testing.assert_equal(np.full((2, 2), 0), ds_merged["B01"].values)
+        self.assertEqual(1, ds_list[0].spatial_ref.item())
+
     def test_get_spatial_dims(self):
         ds = xr.Dataset()
         ds["var"] = xr.DataArray(
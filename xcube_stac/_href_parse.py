@@ -19,6 +19,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
+import functools
 import re
 
 from xcube.core.store import DataStoreError
@@ -92,6 +94,14 @@ def decode_href(href: str) -> tuple[str, str, str, dict]:
         DataStoreError: Error, AWS S3 root cannot be decoded since
             it does not follow the uri pattern mentioned in Note.
     """
+    protocol, root, fs_path, storage_options = _decode_href(href)
+    # the storage options are deep-copied, since the result of _decode_href
+    # is cached and the nested client_kwargs must not be shared with the caller
+    return protocol, root, fs_path, copy.deepcopy(storage_options)
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_href(href: str) -> tuple[str, str, str, dict]:
     protocol, root, fs_path, storage_options = decode_aws_s3_href(href)
     if root is None:
         protocol, remain = href.split("://")
@@ -21,6 +21,7 @@
 import collections
 import copy
 import datetime
+import functools
 import itertools
 import os
 from typing import Any, Container, Dict, Iterator, Union
@@ -39,7 +40,7 @@ from xcube.core.store import (
     DataTypeLike,
 )
 from xcube.core.gridmapping import GridMapping
-from xcube.core.resampling import resample_in_space
+from xcube.core.resampling import encode_grid_mapping, resample_in_space
 
 from .constants import (
     TILE_SIZE,
@@ -510,11 +511,18 @@ def reproject_bbox(bbox, source_crs, target_crs):
     target_crs = normalize_crs(target_crs)
     if source_crs == target_crs:
         return bbox
-    t = pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+    t = _get_transformer(source_crs, target_crs)
     (x1, x2), (y1, y2) = t.transform((bbox[0], bbox[2]), (bbox[1], bbox[3]))
     return [x1, y1, x2, y2]
 
 
+@functools.lru_cache(maxsize=64)
+def _get_transformer(
+    source_crs: pyproj.CRS, target_crs: pyproj.CRS
+) -> pyproj.Transformer:
+    return pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
 def convert_to_solar_time(
     utc: datetime.datetime, longitude: float
 ) -> datetime.datetime:
@@ -528,7 +536,12 @@ def normalize_crs(crs: Union[str, pyproj.CRS]) -> pyproj.CRS:
     if isinstance(crs, pyproj.CRS):
         return crs
     else:
-        return pyproj.CRS.from_string(crs)
+        return _crs_from_string(crs)
+
+
+@functools.lru_cache(maxsize=128)
+def _crs_from_string(crs: str) -> pyproj.CRS:
+    return pyproj.CRS.from_string(crs)
 
 
 def get_center_from_bbox(bbox: list[float]) -> tuple[float, float]:
@@ -536,12 +549,11 @@ def get_center_from_bbox(bbox: list[float]) -> tuple[float, float]:
 
 
 def rename_dataset(ds: xr.Dataset, asset: str) -> xr.Dataset:
-    if len(list(ds.keys())) == 1:
-        name_dict = {var_name: f"{asset}" for var_name in ds.data_vars.keys()}
+    var_names = list(ds.data_vars)
+    if len(var_names) == 1:
+        name_dict = {var_names[0]: f"{asset}"}
     else:
-        name_dict = {
-            var_name: f"{asset}_{var_name}" for var_name in ds.data_vars.keys()
-        }
+        name_dict = {var_name: f"{asset}_{var_name}" for var_name in var_names}
     return ds.rename_vars(name_dict=name_dict)
 
 
@@ -566,8 +578,10 @@ def merge_datasets(
     datasets: list[xr.Dataset], target_gm: GridMapping = None
 ) -> xr.Dataset:
     y_coord, x_coord = get_spatial_dims(datasets[0])
-    x_ress = [abs(float((ds[x_coord][1] - ds[x_coord][0]))) for ds in datasets]
-    y_ress = [abs(float(ds[y_coord][1] - ds[y_coord][0])) for ds in datasets]
+    # read the resolutions from the raw coordinate arrays to avoid
+    # creating intermediate DataArrays
+    x_ress = [_get_res(ds[x_coord].values) for ds in datasets]
+    y_ress = [_get_res(ds[y_coord].values) for ds in datasets]
     if (
         np.unique(x_ress).size == 1
         and np.unique(y_ress).size == 1
@@ -575,28 +589,34 @@ def merge_datasets(
     ):
         ds = _update_datasets(datasets)
     else:
+        idx_target = None
         if target_gm is None:
-            idx = np.argmin(x_ress)
-            target_gm = GridMapping.from_dataset(datasets[idx])
+            idx_target = np.argmin(x_ress)
+            target_gm = GridMapping.from_dataset(datasets[idx_target])
         grouped = collections.defaultdict(lambda: collections.defaultdict(list))
         for idx, (x_res, y_res) in enumerate(zip(x_ress, y_ress)):
             grouped[x_res][y_res].append(idx)
-        datasets_grouped = []
+        datasets_resampled = []
         for _, val in grouped.items():
             for _, idxs in val.items():
-                datasets_grouped.append(
-                    _update_datasets([datasets[idx] for idx in idxs])
+                ds = _update_datasets([datasets[idx] for idx in idxs])
+                # the dataset, from which the target grid mapping is derived,
+                # does not need to be resampled
+                source_gm = target_gm if idxs == [idx_target] else None
+                datasets_resampled.append(
+                    wrapper_resample_in_space(ds, target_gm, source_gm=source_gm)
                 )
-        datasets_resampled = []
-        for ds in datasets_grouped:
-            datasets_resampled.append(wrapper_resample_in_space(ds, target_gm))
         ds = _update_datasets(datasets_resampled)
     if "spatial_ref" in ds.coords:
-        ds["crs"] = ds.coords["spatial_ref"]
-        ds = ds.drop_vars("spatial_ref")
+        # assign returns a new dataset; the input datasets are not modified
+        ds = ds.assign(crs=ds.coords["spatial_ref"]).drop_vars("spatial_ref")
     return ds
 
 
+def _get_res(coord: np.ndarray) -> float:
+    return abs(float(coord[1] - coord[0]))
+
+
 def get_spatial_dims(ds: xr.Dataset) -> (str, str):
     if "lat" in ds and "lon" in ds:
         y_coord, x_coord = "lat", "lon"
@@ -608,14 +628,35 @@ def get_spatial_dims(ds: xr.Dataset) -> (str, str):
 
 
 def _update_datasets(datasets: list[xr.Dataset]) -> xr.Dataset:
-    ds = datasets[0].copy()
-    for ds_asset in datasets[1:]:
-        ds.update(ds_asset)
-    return ds
+    if len(datasets) == 1:
+        return datasets[0]
+    # as with successive Dataset.update calls, the last dataset wins for
+    # variables and non-index coordinates, e.g. spatial_ref, contained in
+    # several datasets; they are dropped from the preceding datasets, so that
+    # they are not merged at all
+    names_seen = set()
+    datasets_unique = []
+    for ds in reversed(datasets):
+        names = set(ds.variables) - set(ds.xindexes)
+        datasets_unique.insert(0, ds.drop_vars(names & names_seen))
+        names_seen |= names
+    # the datasets share the same grid; a single merge aligned to the
+    # first dataset replaces the chain of copy and update calls
+    return xr.merge(
+        datasets_unique, compat="override", join="left", combine_attrs="override"
+    )
 
 
-def wrapper_resample_in_space(ds: xr.Dataset, target_gm: GridMapping) -> xr.Dataset:
-    ds = resample_in_space(ds, target_gm=target_gm, encode_cf=True)
+def wrapper_resample_in_space(
+    ds: xr.Dataset, target_gm: GridMapping, source_gm: GridMapping = None
+) -> xr.Dataset:
+    if source_gm is target_gm:
+        # the dataset already lies on the target grid; only its coordinates
+        # and grid mapping are aligned with the ones of the resampled datasets
+        ds = ds.assign_coords(target_gm.to_coords(exclude_bounds=True))
+        ds = encode_grid_mapping(ds, target_gm)
+    else:
+        ds = resample_in_space(ds, target_gm=target_gm, encode_cf=True)
     vars = [
         "spatial_ref",
         "x_bnds",
@@ -31,6 +31,8 @@ from xcube.core.store import new_data_store
 
 from ._utils import is_valid_ml_data_type
 from .constants import LOG
+from .constants import CDSE_GDAL_ENV_OPTIONS
+from .constants import TILE_SIZE
 from .mldataset import Jp2MultiLevelDataset
 
 
@@ -125,16 +127,19 @@ class S3Sentinel2DataAccessor:
             aws_access_key_id=storage_options["key"],
             aws_secret_access_key=storage_options["secret"],
         )
-        self.env = rasterio.env.Env(session=self.session, AWS_VIRTUAL_HOSTING=False)
+        self.env = rasterio.env.Env(session=self.session, **CDSE_GDAL_ENV_OPTIONS)
         # keep the rasterio environment open so that the data can be accessed
         # when plotting or writing the data
         self.env = self.env.__enter__()
         # dask multi-threading needs to be turned off, otherwise the GDAL
-        # reader for JP2 raises error.
+        # reader for JP2 raises error. The setting is kept process-wide, since
+        # lazily opened datasets are computed after the accessor is closed.
         dask.config.set(scheduler="single-threaded")
 
     def close(self):
-        if self.env is not None:
+        # use getattr, since close is also called via __del__ if __init__
+        # failed before all attributes were assigned
+        if getattr(self, "env", None) is not None:
             LOG.debug("Exit rasterio.env.Env for CDSE data access.")
             self.env.__exit__()
         self.env = None
@@ -157,17 +162,24 @@ class S3Sentinel2DataAccessor:
             opener_id = ""
         if "tile_size" in open_params:
             LOG.info(
-                "The parameter tile_size is set to (1024, 1024), which is the "
-                "native chunk size of the jp2 files in the Sentinel-2 archive."
+                f"The parameter tile_size is set to ({TILE_SIZE}, {TILE_SIZE}), "
+                "which is the native chunk size of the jp2 files in the "
+                "Sentinel-2 archive."
             )
         if is_valid_ml_data_type(data_type) or opener_id.split(":")[0] == "mldataset":
-            return Jp2MultiLevelDataset(access_params, **open_params)
-        else:
-            return rioxarray.open_rasterio(
-                (
-                    f"{access_params["protocol"]}://{access_params["root"]}/"
-                    f"{access_params["fs_path"]}"
-                ),
-                chunks=dict(x=1024, y=1024),
-                band_as_variable=True,
+            return Jp2MultiLevelDataset(
+                access_params, session=self.session, **open_params
             )
+        else:
+            # rasterio environments are thread-local; the data may be opened
+            # in a worker thread, where the environment entered in __init__
+            # is not active.
+            with rasterio.env.Env(session=self.session, **CDSE_GDAL_ENV_OPTIONS):
+                return rioxarray.open_rasterio(
+                    (
+                        f"{access_params["protocol"]}://{access_params["root"]}/"
+                        f"{access_params["fs_path"]}"
+                    ),
+                    chunks=dict(x=TILE_SIZE, y=TILE_SIZE),
+                    band_as_variable=True,
+                )
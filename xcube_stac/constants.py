@@ -40,6 +40,16 @@ DATA_STORE_ID_CDSE = "stac-cdse"
 CDSE_STAC_URL = "https://catalogue.dataspace.copernicus.eu/stac"
 CDSE_S3_ENDPOINT = "https://eodata.dataspace.copernicus.eu"
 MAP_CDSE_COLLECTION_FORMAT = {"Sentinel-2": "jp2"}
+# GDAL configuration options for reading the jp2 files of the CDSE S3 archive;
+# directories are not listed when opening a file, consecutive range requests
+# are merged, and the cache of /vsicurl/ is raised to 128 MB so that the
+# chunks of one file can reuse already downloaded ranges.
+CDSE_GDAL_ENV_OPTIONS = dict(
+    AWS_VIRTUAL_HOSTING=False,
+    GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR",
+    GDAL_HTTP_MERGE_CONSECUTIVE_RANGES="YES",
+    CPL_VSIL_CURL_CACHE_SIZE=str(128 * 1024 * 1024),
+)
 
 # xcube specific constants
 DATA_STORE_ID_XCUBE = "stac-xcube"
@@ -85,6 +95,9 @@ MLDATASET_FORMATS = ["levels", "geotiff", "jp2"]
 COLLECTION_PREFIX = "collections/"
 STAC_CRS = "EPSG:4326"
 TILE_SIZE = 1024
+OPEN_DATA_MAX_WORKERS = 8
+MAX_CACHED_ACCESSORS = 16
+MAX_CACHED_ITEMS = 128
 LOG = logging.getLogger("xcube.stac")
 FloatInt = Union[float, int]
 PROCESSING_BASELINE_KEYS = ["processorVersion", "s2:processing_baseline"]
@@ -1,3 +1,4 @@
+import functools
 from typing import Iterator, Union
 
 import numpy as np
@@ -8,6 +9,7 @@ import s3fs
 
 from .accessor import S3DataAccessor
 from .accessor import S3Sentinel2DataAccessor
+from .constants import FloatInt
 from .constants import MAP_CDSE_COLLECTION_FORMAT
 from .constants import MLDATASET_FORMATS
 from .constants import STAC_SEARCH_PARAMETERS
@@ -26,6 +28,7 @@ from .sen2.constants import CDSE_SENITNEL_2_NO_DATA
 from ._href_parse import decode_href
 from ._utils import get_format_id
 from ._utils import get_format_from_path
+from ._utils import get_assets_from_item
 from ._utils import is_valid_ml_data_type
 from ._utils import list_assets_from_item
 from ._utils import search_items
@@ -47,7 +50,7 @@ class Helper:
         return item
 
     def get_data_access_params(self, item: pystac.Item, **open_params) -> dict:
-        assets = list_assets_from_item(
+        assets = get_assets_from_item(
             item,
             asset_names=open_params.get("asset_names"),
             supported_format_ids=self.supported_format_ids,
@@ -187,10 +190,7 @@ class HelperCdse(Helper):
                 res_want = open_params["spatial_res"] * 111320
         time_end = None
         for asset_name in open_params["asset_names"]:
-            res_avail = CDSE_SENTINEL_2_LEVEL_BAND_RESOLUTIONS[processing_level][
-                asset_name
-            ]
-            res_select = res_avail[np.argmin(abs(np.array(res_avail) - res_want))]
+            res_select = _select_resolution(processing_level, asset_name, res_want)
             if time_end is None:
                 hrefs = self._fs.glob(
                     f"{href_base}/**/*_{asset_name}_{res_select}m.jp2"
@@ -284,3 +284,13 @@ class HelperCdse(Helper):
             if not processing_level[1:] in item.properties["processingLevel"]:
                 continue
             yield item
+
+
+@functools.lru_cache(maxsize=256)
+def _select_resolution(
+    processing_level: str, asset_name: str, res_want: FloatInt
+) -> int:
+    # the available resolutions per band are fixed, so the selection is
+    # cached and not repeated for every item
+    res_avail = CDSE_SENTINEL_2_LEVEL_BAND_RESOLUTIONS[processing_level][asset_name]
+    return res_avail[np.argmin(abs(np.array(res_avail) - res_want))]
@@ -23,6 +23,7 @@ from typing import Any, Optional
 
 import pystac
 import rasterio
+import rasterio.env
 import rasterio.session
 import rioxarray
 import xarray as xr
@@ -31,6 +32,8 @@ from xcube.core.gridmapping import GridMapping
 
 from ._utils import rename_dataset
 from ._utils import merge_datasets
+from .constants import CDSE_GDAL_ENV_OPTIONS
+from .constants import TILE_SIZE
 from .stac_extension.raster import apply_offset_scaling
 
 
@@ -84,14 +87,17 @@ class Jp2MultiLevelDataset(LazyMultiLevelDataset):
     """A multi-level dataset for accessing .jp2 files.
 
     Args:
-        data_id: data identifier
-        items: list of items to be stacked
-        open_params: opening parameters of odc.stack.load
+        access_params: access parameters of the jp2 file
+        session: rasterio session used to access the jp2 file; the levels
+            may be opened in any thread, hence a rasterio environment
+            is entered for each access.
+        open_params: opening parameters of rioxarray.open_rasterio
     """
 
     def __init__(
         self,
         access_params: dict,
+        session: Optional[rasterio.session.Session] = None,
         **open_params: dict[str, Any],
     ):
         file_path = (
@@ -100,18 +106,45 @@ class Jp2MultiLevelDataset(LazyMultiLevelDataset):
         )
         self._file_path = file_path
         self._access_params = access_params
+        self._session = session
         self._open_params = open_params
+        self._num_overviews = None
+        self._chunks = None
         super().__init__(ds_id=file_path)
 
     def _get_num_levels_lazily(self) -> int:
-        with rasterio.open(self._file_path) as rio_dataset:
-            overviews = rio_dataset.overviews(1)
-        return len(overviews) + 1
+        if self._num_overviews is None:
+            self._read_file_info()
+        return self._num_overviews + 1
 
     def _get_dataset_lazily(self, index: int, parameters) -> xr.Dataset:
-        return rioxarray.open_rasterio(
-            self._file_path,
-            overview_level=index - 1 if index > 0 else None,
-            chunks=dict(x=1024, y=1024),
-            band_as_variable=True,
+        if self._chunks is None:
+            self._read_file_info()
+        with self._get_env():
+            return rioxarray.open_rasterio(
+                self._file_path,
+                overview_level=index - 1 if index > 0 else None,
+                chunks=self._chunks,
+                band_as_variable=True,
+            )
+
+    def _read_file_info(self):
+        with self._get_env():
+            with rasterio.open(self._file_path) as rio_dataset:
+                num_overviews = len(rio_dataset.overviews(1))
+                block_height, block_width = rio_dataset.block_shapes[0]
+        # the chunks are a multiple of the internal block size of the jp2
+        # file, so that no block is read and decoded for several chunks
+        self._chunks = dict(
+            x=_get_chunk_size(block_width), y=_get_chunk_size(block_height)
         )
+        self._num_overviews = num_overviews
+
+    def _get_env(self) -> rasterio.env.Env:
+        # rasterio environments are thread-local, so they cannot be shared
+        # with the threads the levels are requested from
+        return rasterio.env.Env(session=self._session, **CDSE_GDAL_ENV_OPTIONS)
+
+
+def _get_chunk_size(block_size: int) -> int:
+    return max(block_size, (TILE_SIZE // block_size) * block_size)
@@ -1,7 +1,11 @@
+from typing import Optional
+
+import numpy as np
 import pystac
 import xarray as xr
 
 from ..constants import LOG
+from ..constants import FloatInt
 
 
 def apply_offset_scaling(
@@ -28,12 +32,50 @@ def apply_offset_scaling(
         )
         return ds
 
+    nodata_val = None
     if asset_name.lower() != "scl":
         nodata_val = raster_bands[0].get("nodata")
-        if nodata_val is not None:
-            ds[asset_name] = ds[asset_name].where(ds[asset_name] != nodata_val)
     scale = raster_bands[0].get("scale", 1)
-    ds[asset_name] *= scale
     offset = raster_bands[0].get("offset", 0)
-    ds[asset_name] += offset
+
+    data_array = ds[asset_name]
+    dtype = data_array.dtype
+    if not np.issubdtype(dtype, np.floating):
+        # follow xarray's promotion: masking integers of up to 16 bits
+        # yields float32, any other float operation yields float64
+        if nodata_val is not None:
+            dtype = np.result_type(dtype, np.float32)
+        elif isinstance(scale, float) or isinstance(offset, float):
+            dtype = np.dtype(np.float64)
+    # an identity scale and offset, e.g. 1.0 and 0.0, still promotes
+    # integer data, hence only data that would stay the same is returned
+    if nodata_val is None and scale == 1 and offset == 0 and dtype == data_array.dtype:
+        return ds
+    # masking, scaling, and offsetting are fused into one blockwise
+    # operation, so that the data is passed only once per chunk
+    ds[asset_name] = xr.apply_ufunc(
+        _apply_offset_scaling_block,
+        data_array,
+        kwargs=dict(nodata_val=nodata_val, scale=scale, offset=offset, dtype=dtype),
+        dask="parallelized",
+        output_dtypes=[dtype],
+        keep_attrs=True,
+    )
     return ds
+
+
+def _apply_offset_scaling_block(
+    arr: np.ndarray,
+    nodata_val: Optional[FloatInt],
+    scale: FloatInt,
+    offset: FloatInt,
+    dtype: np.dtype,
+) -> np.ndarray:
+    out = arr.astype(dtype)
+    if scale != 1:
+        out *= scale
+    if offset != 0:
+        out += offset
+    if nodata_val is not None:
+        out[arr == nodata_val] = np.nan
+    return out
@@ -48,39 +48,34 @@ def groupby_solar_day(items: list[pystac.Item]) -> dict:
             processing_baseline = float(item.properties[processing_baseline_key])
         nested_dict[date][processing_baseline].append(item)
 
-    # if two processing baselines are available, take most recent one
+    # if two processing baselines are available, take most recent one;
+    # the items are keyed directly by the timestamp of the first item
     grouped = {}
-    for date, proc_version_dic in nested_dict.items():
-        proc_version = max(list(proc_version_dic.keys()))
-        grouped[date] = nested_dict[date][proc_version]
-
-    # get timestamp
-    grouped_new = {}
-    for date, items in grouped.items():
-        dt = items[0].properties["datetime_nominal"].replace(tzinfo=None)
-        grouped_new[dt] = items
-    return grouped_new
+    for proc_version_dic in nested_dict.values():
+        items_date = proc_version_dic[max(proc_version_dic)]
+        dt = items_date[0].properties["datetime_nominal"].replace(tzinfo=None)
+        grouped[dt] = items_date
+    return grouped
 
 
 def mosaic_take_first(list_ds: list[xr.Dataset]) -> xr.Dataset:
     if len(list_ds) == 1:
         return list_ds[0]
-    dim = "dummy"
-    ds = xr.concat(list_ds, dim=dim)
-    if "crs" in ds:
-        ds = ds.drop_vars("crs")
-    y_coord, x_coord = get_spatial_dims(ds)
+    y_coord, x_coord = get_spatial_dims(list_ds[0])
     ds_mosaic = xr.Dataset()
-    for key in ds:
-        axis = ds[key].dims.index(dim)
-        da_arr = ds[key].data
-        nan_mask = da.isnan(da_arr)
-        first_non_nan_index = (~nan_mask).argmax(axis=axis)
-        da_arr_select = da.choose(first_non_nan_index, da_arr)
+    for key in list_ds[0]:
+        if key == "crs":
+            continue
+        # fill the NaN pixels with the values of the following datasets;
+        # this is a chain of element-wise selections, which avoids the
+        # concatenation along a dummy dimension and the argmax/choose graph
+        da_arr = list_ds[0][key].data
+        for ds in list_ds[1:]:
+            da_arr = da.where(da.isnan(da_arr), ds[key].data, da_arr)
         ds_mosaic[key] = xr.DataArray(
-            da_arr_select,
+            da_arr,
             dims=(y_coord, x_coord),
-            coords={y_coord: ds[y_coord], x_coord: ds[x_coord]},
+            coords={y_coord: list_ds[0][y_coord], x_coord: list_ds[0][x_coord]},
         )
     if "crs" in list_ds[0]:
         ds_mosaic["crs"] = list_ds[0].crs
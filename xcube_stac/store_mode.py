@@ -19,10 +19,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import collections
+from concurrent.futures import ThreadPoolExecutor
 import json
 from typing import Iterator, Union
 
 import numpy as np
+import pandas as pd
 import pystac
 import pystac_client.client
 import requests
@@ -38,9 +41,12 @@ from .accessor import (
     S3DataAccessor,
 )
 from .constants import LOG
+from .constants import MAX_CACHED_ACCESSORS
+from .constants import MAX_CACHED_ITEMS
 from .constants import STAC_SEARCH_PARAMETERS_STACK_MODE
 from .helper import Helper
 from .constants import COLLECTION_PREFIX
+from .constants import OPEN_DATA_MAX_WORKERS
 from .constants import TILE_SIZE
 from .mldataset import SingleItemMultiLevelDataset
 from .stac_extension.raster import apply_offset_scaling
@@ -100,12 +106,16 @@ class SingleStoreMode:
         helper: Helper,
     ):
         self._catalog = catalog
+        # the self href is resolved once, since it is added to the
+        # attributes of every opened dataset
+        self._catalog_url = catalog.get_self_href()
         self._url_mod = url_mod
         self._searchable = searchable
         self._storage_options_s3 = storage_options_s3
         self._helper = helper
-        self._https_accessor = None
-        self._s3_accessor = None
+        self._https_accessors = collections.OrderedDict()
+        self._s3_accessors = collections.OrderedDict()
+        self._item_dicts = collections.OrderedDict()
 
     def access_item(self, data_id: str) -> pystac.Item:
         """Access item for a given data ID.
@@ -119,16 +129,24 @@ class SingleStoreMode:
         Raises:
             DataStoreError: Error, if the item json cannot be accessed.
         """
-        response = requests.request(method="GET", url=f"{self._url_mod}{data_id}")
-        if response.ok:
-            return pystac.Item.from_dict(
-                json.loads(response.text),
-                href=f"{self._url_mod}{data_id}",
-                root=self._catalog,
-                preserve_dict=False,
-            )
+        url = f"{self._url_mod}{data_id}"
+        if url in self._item_dicts:
+            self._item_dicts.move_to_end(url)
         else:
-            raise DataStoreError(response.raise_for_status())
+            response = requests.request(method="GET", url=url)
+            if not response.ok:
+                raise DataStoreError(response.raise_for_status())
+            self._item_dicts[url] = json.loads(response.text)
+            if len(self._item_dicts) > MAX_CACHED_ITEMS:
+                self._item_dicts.popitem(last=False)
+        # the item is created from a copy of the cached dictionary, since
+        # items may be modified afterward, e.g. by the helper's parse_item
+        return pystac.Item.from_dict(
+            self._item_dicts[url],
+            href=url,
+            root=self._catalog,
+            preserve_dict=True,
+        )
 
     def get_data_ids(
         self, data_type: DataTypeLike = None
@@ -229,7 +247,7 @@ class SingleStoreMode:
         access_params = self._helper.get_data_access_params(
             parsed_item, opener_id=opener_id, data_type=data_type, **open_params
         )
-        list_ds_asset = []
+        open_tasks = {}
         for asset_key, params in access_params.items():
             if opener_id is not None:
                 key = "_".join(opener_id.split(":")[:2])
@@ -243,23 +261,11 @@ class SingleStoreMode:
                     f"open_params_dataset_{params["format_id"]}", {}
                 )
 
-            # open data with respective xcube data opener
+            # get the respective xcube data opener
             if params["protocol"] == "https":
                 opener = self._get_https_accessor(params)
-                ds_asset = opener.open_data(
-                    params,
-                    opener_id=opener_id,
-                    data_type=data_type,
-                    **open_params_asset,
-                )
             elif params["protocol"] == "s3":
                 opener = self._get_s3_accessor(params)
-                ds_asset = opener.open_data(
-                    params,
-                    opener_id=opener_id,
-                    data_type=data_type,
-                    **open_params_asset,
-                )
             else:
                 url = get_url_from_pystac_object(item)
                 raise DataStoreError(
@@ -267,16 +273,32 @@ class SingleStoreMode:
                     f"{params["protocol"]!r}. The asset {asset_key!r} has a href "
                     f"{params["href"]!r}. The item's url is given by {url!r}."
                 )
+            open_tasks[asset_key] = (opener, params, open_params_asset)
+
+        def open_asset(task: tuple) -> Union[xr.Dataset, MultiLevelDataset]:
+            opener, params, open_params_asset = task
+            return opener.open_data(
+                params, opener_id=opener_id, data_type=data_type, **open_params_asset
+            )
+
+        # the data openers are resolved above in the calling thread; opening
+        # the assets is dominated by I/O latency and is done concurrently,
+        # a single asset is opened directly without a thread pool
+        if len(open_tasks) == 1:
+            ds_assets = [open_asset(task) for task in open_tasks.values()]
+        else:
+            with ThreadPoolExecutor(max_workers=OPEN_DATA_MAX_WORKERS) as executor:
+                ds_assets = list(executor.map(open_asset, open_tasks.values()))
 
+        list_ds_asset = []
+        for asset_key, ds_asset in zip(open_tasks.keys(), ds_assets):
             if isinstance(ds_asset, xr.Dataset):
                 ds_asset = rename_dataset(ds_asset, asset_key)
                 if open_params.get("apply_scaling", False):
                     ds_asset = apply_offset_scaling(ds_asset, parsed_item, asset_key)
             list_ds_asset.append(ds_asset)
 
-        attrs = dict(
-            stac_catalog_url=self._catalog.get_self_href(), stac_item_id=item.id
-        )
+        attrs = dict(stac_catalog_url=self._catalog_url, stac_item_id=item.id)
 
         if all(isinstance(ds, MultiLevelDataset) for ds in list_ds_asset):
             ds = SingleItemMultiLevelDataset(
@@ -299,7 +321,9 @@ class SingleStoreMode:
     def _get_s3_accessor(self, access_params: dict) -> S3DataAccessor:
         """This function returns the S3 data accessor associated with the
         bucket *root*. It creates the S3 data accessor only if it is not
-        created yet or if *root* changes.
+        created yet for *root*. The most recently used accessors are kept,
+        so that items with assets in several buckets do not need to
+        re-initialize the accessors.
 
         Args:
             access_params: dictionary containing access parameter for one asset
@@ -307,37 +331,34 @@ class SingleStoreMode:
         Returns:
             S3 data opener
         """
-
-        if self._s3_accessor is None:
-            self._s3_accessor = self._helper.s3_accessor(
-                access_params["root"],
-                storage_options=update_dict(
-                    self._storage_options_s3,
-                    access_params["storage_options"],
-                    inplace=False,
-                ),
-            )
-        elif not self._s3_accessor.root == access_params["root"]:
-            LOG.debug(
-                f"The bucket {self._s3_accessor.root!r} of the "
-                f"S3 object storage changed to {access_params["root"]!r}. "
-                "A new s3 data opener will be initialized."
-            )
-            self._s3_accessor = self._helper.s3_accessor(
-                access_params["root"],
-                storage_options=update_dict(
-                    self._storage_options_s3,
-                    access_params["storage_options"],
-                    inplace=False,
-                ),
-            )
-
-        return self._s3_accessor
+        root = access_params["root"]
+        if root in self._s3_accessors:
+            self._s3_accessors.move_to_end(root)
+            return self._s3_accessors[root]
+
+        LOG.debug(
+            f"A new s3 data opener will be initialized for the bucket {root!r} "
+            "of the S3 object storage."
+        )
+        accessor = self._helper.s3_accessor(
+            root,
+            storage_options=update_dict(
+                self._storage_options_s3,
+                access_params["storage_options"],
+                inplace=False,
+            ),
+        )
+        self._s3_accessors[root] = accessor
+        if len(self._s3_accessors) > MAX_CACHED_ACCESSORS:
+            self._s3_accessors.popitem(last=False)
+        return accessor
 
     def _get_https_accessor(self, access_params: dict) -> HttpsDataAccessor:
         """This function returns the HTTPS data opener associated with the
-        *root* url and the *opener_id*. It creates the HTTPS data opener
-        only if it is not created yet or if *root* or *opener_id* changes.
+        *root* url. It creates the HTTPS data opener only if it is not
+        created yet for *root*. The most recently used accessors are kept,
+        so that items with assets under several roots do not need to
+        re-initialize the accessors.
 
         Args:
             access_params: dictionary containing asset parameters for one asset
@@ -345,16 +366,17 @@ class SingleStoreMode:
         Returns:
             HTTPS data opener
         """
-        if self._https_accessor is None:
-            self._https_accessor = HttpsDataAccessor(access_params["root"])
-        elif not self._https_accessor.root == access_params["root"]:
-            LOG.debug(
-                f"The root {self._https_accessor.root!r} of the "
-                f"https data opener changed to {access_params["root"]!r}. "
-                "A new https data opener will be initialized."
-            )
-            self._https_accessor = HttpsDataAccessor(access_params["root"])
-        return self._https_accessor
+        root = access_params["root"]
+        if root in self._https_accessors:
+            self._https_accessors.move_to_end(root)
+            return self._https_accessors[root]
+
+        LOG.debug(f"A new https data opener will be initialized for {root!r}.")
+        accessor = HttpsDataAccessor(root)
+        self._https_accessors[root] = accessor
+        if len(self._https_accessors) > MAX_CACHED_ACCESSORS:
+            self._https_accessors.popitem(last=False)
+        return accessor
 
     def _get_open_params_data_opener(
         self,
@@ -481,13 +503,11 @@ class StackStoreMode(SingleStoreMode):
             raise NotImplementedError("mldataset not supported in stacking mode")
         else:
             ds = self.stack_items(grouped_items, **open_params)
-            ds.attrs["stac_catalog_url"] = self._catalog.get_self_href()
-            ds.attrs["stac_item_ids"] = dict(
-                {
-                    date.isoformat(): [item.id for item in items]
-                    for date, items in grouped_items.items()
-                }
-            )
+            ds.attrs["stac_catalog_url"] = self._catalog_url
+            ds.attrs["stac_item_ids"] = {
+                date.isoformat(): [item.id for item in items]
+                for date, items in grouped_items.items()
+            }
         return ds
 
     def stack_items(
@@ -522,8 +542,15 @@ class StackStoreMode(SingleStoreMode):
                 list_ds_items.append(ds)
             ds_mosaic = mosaic_take_first(list_ds_items)
             ds_dates.append(ds_mosaic)
-        ds = xr.concat(ds_dates, dim="time")
-        ds = ds.assign_coords(coords=dict(time=np_datetimes))
+        # all mosaics are resampled to target_gm, so the spatial coordinates
+        # are identical and the alignment of xr.concat can be skipped
+        ds = xr.concat(
+            ds_dates,
+            dim=pd.DatetimeIndex(np_datetimes, name="time"),
+            coords="minimal",
+            compat="override",
+            join="override",
+        )
         if "crs" in ds:
             ds = ds.drop_vars("crs")
             ds["crs"] = ds_dates[0].crs